@@ -2,6 +2,7 @@
 import numpy as np
 from astropy.units import Quantity
 from astropy.table import Table
+from astropy.time import Time
 from ..utils.time import time_ref_from_dict, time_relative_to_ref
 from ..utils.scripts import make_path
 
@@ -116,22 +117,17 @@ class GTI:
         gti : `GTI`
             Copy of the GTI table with selection applied.
         """
+        # accept e.g. a list of two scalar `~astropy.time.Time` objects
+        time_interval = Time(time_interval)
+
         # get GTIs that fall within the time_interval
         mask = self.time_start < time_interval[1]
         mask &= self.time_stop > time_interval[0]
         gti_within = self.table[mask]
 
         # crop the GTIs
-        start_met = time_relative_to_ref(time_interval[0], self.table.meta)
-        stop_met = time_relative_to_ref(time_interval[1], self.table.meta)
-        np.clip(
-            gti_within["START"],
-            start_met.value,
-            stop_met.value,
-            out=gti_within["START"],
-        )
-        np.clip(
-            gti_within["STOP"], start_met.value, stop_met.value, out=gti_within["STOP"]
-        )
+        start_met, stop_met = time_relative_to_ref(time_interval, self.table.meta).sec
+        np.clip(gti_within["START"], start_met, stop_met, out=gti_within["START"])
+        np.clip(gti_within["STOP"], start_met, stop_met, out=gti_within["STOP"])
 
         return self.__class__(gti_within)
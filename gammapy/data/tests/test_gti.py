@@ -70,6 +70,14 @@ def test_gti_fermi():
             Time([54682.65603794185, 57236.96833546296], format="mjd", scale="tt"),
         ),
         (Time([10.0, 20.0], format="mjd", scale="tt"), 0, None),
+        (
+            [
+                Time(54682.68125, format="mjd", scale="tt"),
+                Time(54682.79861111, format="mjd", scale="tt"),
+            ],
+            2,
+            Time([54682.68125, 54682.79861111], format="mjd", scale="tt"),
+        ),
     ],
 )
 def test_select_time(time_interval, expected_length, expected_times):
@@ -27,6 +27,7 @@ GAMMAPY_DEPENDENCIES = [
     "iminuit",
     "naima",
     "uncertainties",
+    "numba",
 ]
 
 GAMMAPY_ENV_VARIABLES = [
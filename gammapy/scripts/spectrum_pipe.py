@@ -1,7 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import logging
-import yaml
-from ..utils.scripts import make_path
+from ..utils.scripts import make_path, write_yaml
 from ..utils.fitting import Fit
 from ..spectrum import (
     FluxPointsEstimator,
@@ -102,11 +101,7 @@ class SpectrumAnalysisIACT:
         mode : str
             Write mode
         """
-        d = self._result_dict
-        val = yaml.safe_dump(d, default_flow_style=False)
-
-        with open(str(filename), mode) as outfile:
-            outfile.write(val)
+        write_yaml(self._result_dict, filename, mode=mode)
 
     def run_fit(self, optimize_opts=None):
         """Run all step for the spectrum fit."""
@@ -176,11 +176,11 @@ class CountsSpectrum:
         ax.errorbar(x, counts, xerr=xerr, yerr=yerr, **kwargs)
         if show_energy is not None:
             ener_val = u.Quantity(show_energy).to_value(energy_unit)
-            ax.vlines(ener_val, 0, 1.1 * max(self.data), linestyles="dashed")
+            ax.vlines(ener_val, 0, 1.1 * self.data.max(), linestyles="dashed")
         ax.set_xlabel("Energy [{}]".format(energy_unit))
         ax.set_ylabel("Counts")
         ax.set_xscale("log")
-        ax.set_ylim(0, 1.2 * max(self.data))
+        ax.set_ylim(0, 1.2 * self.data.max())
         return ax
 
     def plot_hist(self, ax=None, energy_unit="TeV", show_energy=None, **kwargs):
@@ -208,7 +208,7 @@ class CountsSpectrum:
         ax.hist(x, bins=bins, weights=weights, **kwargs)
         if show_energy is not None:
             ener_val = u.Quantity(show_energy).to_value(energy_unit)
-            ax.vlines(ener_val, 0, 1.1 * max(self.data), linestyles="dashed")
+            ax.vlines(ener_val, 0, 1.1 * self.data.max(), linestyles="dashed")
         ax.set_xlabel("Energy [{}]".format(energy_unit))
         ax.set_ylabel("Counts")
         ax.set_xscale("log")
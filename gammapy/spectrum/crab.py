@@ -1,10 +1,15 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import math
+from functools import lru_cache
 import numpy as np
+from numpy.polynomial.polynomial import polyval
 from astropy import units as u
 from .models import PowerLaw, LogParabola, ExponentialCutoffPowerLaw, SpectralModel
 
 __all__ = ["create_crab_spectral_model"]
 
+_LN10 = math.log(10.0)
+
 # HESS publication: 2006A&A...457..899A
 hess_pl = {
     "amplitude": 3.45e-11 * u.Unit("1 / (cm2 s TeV)"),
@@ -34,7 +39,7 @@ hegra = {
 magic_lp = {
     "amplitude": 3.23e-11 * u.Unit("1 / (cm2 s TeV)"),
     "alpha": 2.47,
-    "beta": 0.24 / np.log(10),
+    "beta": 0.24 / _LN10,
     "reference": 1 * u.TeV,
 }
 
@@ -46,6 +51,46 @@ magic_ecpl = {
 }
 
 
+def _evaluate_meyer_numpy(energy, coefficients):
+    """Evaluate ``10 ** P(log10(energy)) / energy ** 2`` on plain arrays.
+
+    The ``coefficients`` of the polynomial ``P`` are given in order of
+    increasing degree.
+    """
+    log_energy = np.log10(energy)
+    log_flux = polyval(log_energy, coefficients)
+    return np.exp(log_flux * _LN10) / energy ** 2
+
+
+def _evaluate_meyer_loop(energy, coefficients):
+    """Loop version of `_evaluate_meyer_numpy` for 1D arrays, compiled with numba."""
+    out = np.empty_like(energy)
+    for i in range(energy.size):
+        x = np.log10(energy[i])
+        log_flux = 0.0
+        for j in range(coefficients.size - 1, -1, -1):
+            log_flux = log_flux * x + coefficients[j]
+        out[i] = np.exp(log_flux * _LN10) / (energy[i] * energy[i])
+    return out
+
+
+@lru_cache(maxsize=None)
+def _get_evaluate_meyer_numba():
+    """Compiled `_evaluate_meyer_loop`, or ``None`` if numba isn't installed.
+
+    numba is imported on first use only, to keep it out of the import time
+    of `gammapy.spectrum`.
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    # error_model="numpy" and no fastmath, to get the same nan / inf results
+    # as the numpy version instead of a ZeroDivisionError
+    return numba.njit(cache=True, error_model="numpy")(_evaluate_meyer_loop)
+
+
 class MeyerCrabModel(SpectralModel):
     """Meyer 2010 log polynomial Crab spectral model.
 
@@ -53,14 +98,37 @@ class MeyerCrabModel(SpectralModel):
     """
 
     coefficients = np.array([-0.00449161, 0, 0.0473174, -0.179475, -0.53616, -10.2708])
+    # ``polyval`` expects coefficients in order of increasing degree. The
+    # erg to TeV conversion is absorbed in the constant term, so that the
+    # model is evaluated directly in ``1 / (cm2 s TeV)`` for energy in TeV.
+    _coefficients_ascending = coefficients[::-1].copy()
+    _coefficients_ascending[0] += np.log10(u.Unit("erg").to("TeV"))
 
     @staticmethod
     def evaluate(energy):
-        polynomial = np.poly1d(MeyerCrabModel.coefficients)
-        log_energy = np.log10(energy.to_value("TeV"))
-        log_flux = polynomial(log_energy)
-        flux = u.Quantity(np.power(10, log_flux), "erg / (cm2 s)", copy=False)
-        return flux / energy ** 2
+        # contiguous float64 input allows numpy's SIMD loops for log10 / exp
+        energy = np.asarray(energy.to_value("TeV"), dtype=np.float64, order="C")
+        coefficients = MeyerCrabModel._coefficients_ascending
+        evaluate_numba = _get_evaluate_meyer_numba()
+
+        if evaluate_numba is None:
+            flux = _evaluate_meyer_numpy(energy, coefficients)
+        else:
+            flux = evaluate_numba(energy.ravel(), coefficients)
+            flux = flux.reshape(energy.shape)
+
+        return u.Quantity(flux, "cm-2 s-1 TeV-1", copy=False)
+
+
+# Spectral model class and parameters (``None`` for no arguments) per reference
+_CRAB_REFERENCES = {
+    "meyer": (MeyerCrabModel, None),
+    "hegra": (PowerLaw, hegra),
+    "hess_pl": (PowerLaw, hess_pl),
+    "hess_ecpl": (ExponentialCutoffPowerLaw, hess_ecpl),
+    "magic_lp": (LogParabola, magic_lp),
+    "magic_ecpl": (ExponentialCutoffPowerLaw, magic_ecpl),
+}
 
 
 def create_crab_spectral_model(reference="meyer"):
@@ -112,28 +180,10 @@ def create_crab_spectral_model(reference="meyer"):
         3.5350582166 %
     """
 
-    if reference == "meyer":
-        model = MeyerCrabModel()
-    elif reference == "hegra":
-        model = PowerLaw(**hegra)
-    elif reference == "hess_pl":
-        model = PowerLaw(**hess_pl)
-    elif reference == "hess_ecpl":
-        model = ExponentialCutoffPowerLaw(**hess_ecpl)
-    elif reference == "magic_lp":
-        model = LogParabola(**magic_lp)
-    elif reference == "magic_ecpl":
-        model = ExponentialCutoffPowerLaw(**magic_ecpl)
-    else:
+    try:
+        cls, kwargs = _CRAB_REFERENCES[reference]
+    except KeyError:
         fmt = "Invalid reference: {!r}. Choices: {!r}"
-        references = [
-            "meyer",
-            "hegra",
-            "hess_pl",
-            "hess_ecpl",
-            "magic_lp",
-            "magic_ecpl",
-        ]
-        raise ValueError(fmt.format(reference, references))
-
-    return model
+        raise ValueError(fmt.format(reference, list(_CRAB_REFERENCES)))
+
+    return cls() if kwargs is None else cls(**kwargs)
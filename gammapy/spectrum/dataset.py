@@ -204,10 +204,10 @@ class SpectrumDataset(Dataset):
         self.npred().plot(ax=ax, label="mu_src", energy_unit=self._e_unit)
         self.excess.plot(ax=ax, label="Excess", fmt=".", energy_unit=self._e_unit)
 
-        e_min, e_max = self.energy_range
+        e_min, e_max = self.energy_range.to_value(self._e_unit)
         kwargs = {"color": "black", "linestyle": "dashed"}
-        ax.axvline(e_min.to_value(self._e_unit), label="fit range", **kwargs)
-        ax.axvline(e_max.to_value(self._e_unit), **kwargs)
+        ax.axvline(e_min, label="fit range", **kwargs)
+        ax.axvline(e_max, **kwargs)
 
         ax.legend(numpoints=1)
         ax.set_title("")
@@ -235,7 +235,7 @@ class SpectrumDataset(Dataset):
         residuals.plot(ax=ax, ecolor="black", fmt="none", energy_unit=self._e_unit)
         ax.axhline(0, color="black", lw=0.5)
 
-        ymax = 1.2 * max(residuals.data)
+        ymax = 1.2 * residuals.data.max()
         ax.set_ylim(-ymax, ymax)
 
         ax.set_xlabel("Energy [{}]".format(self._e_unit))
@@ -341,7 +341,12 @@ class SpectrumDatasetOnOff(SpectrumDataset):
             alpha=self.alpha,
             mu_sig=mu_sig,
         )
-        return np.nan_to_num(on_stat_)
+        # wstat returns a new array, so clean it up in place, with the
+        # same result as np.nan_to_num
+        on_stat_[np.isnan(on_stat_)] = 0
+        finfo = np.finfo(on_stat_.dtype)
+        np.clip(on_stat_, finfo.min, finfo.max, out=on_stat_)
+        return on_stat_
 
     @classmethod
     def read(cls, filename):
@@ -363,7 +368,8 @@ class SpectrumDatasetOnOff(SpectrumDataset):
         """Quick-look summary plots."""
         import matplotlib.pyplot as plt
 
-        e_min, e_max = self.energy_range
+        energy_range = self.energy_range
+        e_min, e_max = energy_range
 
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(nrows=2, ncols=2, figsize=figsize)
 
@@ -383,15 +389,15 @@ class SpectrumDatasetOnOff(SpectrumDataset):
             show_energy=(e_min, e_max),
         )
 
-        ax1.set_xlim(
-            0.7 * e_min.to_value(energy_unit), 1.3 * e_max.to_value(energy_unit)
-        )
+        e_min_value, e_max_value = energy_range.to_value(energy_unit)
+        ax1.set_xlim(0.7 * e_min_value, 1.3 * e_max_value)
         ax1.legend(numpoints=1)
 
         ax2.set_title("Effective Area")
         e_unit = self.aeff.energy.unit
         self.aeff.plot(ax=ax2, show_energy=(e_min, e_max))
-        ax2.set_xlim(0.7 * e_min.to_value(e_unit), 1.3 * e_max.to_value(e_unit))
+        e_min_value, e_max_value = energy_range.to_value(e_unit)
+        ax2.set_xlim(0.7 * e_min_value, 1.3 * e_max_value)
 
         ax3.axis("off")
 
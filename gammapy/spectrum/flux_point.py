@@ -1228,10 +1228,11 @@ class FluxPointsDataset(Dataset):
 
         Definition: ``(data - model) / model``
         """
+        return self._residuals(self.flux_pred())
+
+    def _residuals(self, model):
         fp = self.data
         data = fp.table[fp.sed_type].quantity
-
-        model = self.model(fp.e_ref)
         residuals = ((data - model) / model).to_value("")
 
         # Remove residuals for upper_limits
@@ -1284,15 +1285,16 @@ class FluxPointsDataset(Dataset):
 
         ax = plt.gca() if ax is None else ax
 
-        residuals = self.residuals()
-
         fp = self.data
 
+        # evaluate the model once for residuals and errors
+        model = self.flux_pred()
+        residuals = self._residuals(model)
+
         xerr = fp._plot_get_energy_err()
         if xerr is not None:
             xerr = xerr[0].to_value(self._e_unit), xerr[1].to_value(self._e_unit)
 
-        model = self.model(fp.e_ref)
         yerr = fp._plot_get_flux_err(fp.sed_type)
         yerr = (yerr[0] / model).to_value(""), (yerr[1] / model).to_value("")
 
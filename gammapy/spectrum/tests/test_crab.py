@@ -1,8 +1,15 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import pytest
+import numpy as np
+from numpy.testing import assert_allclose
 import astropy.units as u
-from ...utils.testing import assert_quantity_allclose
+from ...utils.testing import assert_quantity_allclose, requires_dependency
 from ...spectrum import create_crab_spectral_model
+from ..crab import (
+    MeyerCrabModel,
+    _evaluate_meyer_numpy,
+    _get_evaluate_meyer_numba,
+)
 
 CRAB_SPECTRA = [
     dict(
@@ -64,3 +71,16 @@ def test_crab_spectrum(spec):
 def test_invalid_format():
     with pytest.raises(ValueError):
         create_crab_spectral_model("spam")
+
+
+@requires_dependency("numba")
+def test_meyer_numba():
+    evaluate_numba = _get_evaluate_meyer_numba()
+    energy = np.append(np.logspace(-2, 2, 10), [0, np.nan, -1, 1e-200])
+    coefficients = MeyerCrabModel._coefficients_ascending
+
+    with np.errstate(all="ignore"):
+        actual = evaluate_numba(energy, coefficients)
+        desired = _evaluate_meyer_numpy(energy, coefficients)
+
+    assert_allclose(actual, desired, rtol=1e-12, equal_nan=True)
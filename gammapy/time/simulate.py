@@ -56,7 +56,7 @@ def random_times(
     random_state = get_random_state(random_state)
 
     dead_time = TimeDelta(dead_time)
-    scale = (1 / rate).to("s").value
+    scale = (1 / rate).to_value("s")
     time_delta = random_state.exponential(scale=scale, size=size)
     time_delta += dead_time.to("s").value
 
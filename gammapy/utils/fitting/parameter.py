@@ -328,18 +328,25 @@ class Parameters:
 
     def to_table(self):
         """Convert parameter attributes to `~astropy.table.Table`."""
-        t = Table()
-        t["name"] = [p.name for p in self.parameters]
-        t["value"] = [p.value for p in self.parameters]
+        pars = self.parameters
         if self.covariance is None:
-            t["error"] = np.nan
+            error = np.full(len(pars), np.nan)
         else:
-            t["error"] = [self.error(idx) for idx in range(len(self.parameters))]
-
-        t["unit"] = [p.unit.to_string("fits") for p in self.parameters]
-        t["min"] = [p.min for p in self.parameters]
-        t["max"] = [p.max for p in self.parameters]
-        t["frozen"] = [p.frozen for p in self.parameters]
+            error = np.sqrt(np.diag(self.covariance))
+
+        # collect all columns first and create the table in one go
+        t = Table(
+            [
+                [p.name for p in pars],
+                [p.value for p in pars],
+                error,
+                [p.unit.to_string("fits") for p in pars],
+                [p.min for p in pars],
+                [p.max for p in pars],
+                [p.frozen for p in pars],
+            ],
+            names=["name", "value", "error", "unit", "min", "max", "frozen"],
+        )
 
         for name in ["value", "error", "min", "max"]:
             t[name].format = ".3e"
@@ -360,10 +367,10 @@ class Parameters:
                     frozen=par["frozen"],
                 )
             )
-        try:
-            covariance = np.array(val["covariance"])
-        except KeyError:
-            covariance = None
+        # ``to_dict`` stores ``None`` if no covariance is set
+        covariance = val.get("covariance")
+        if covariance is not None:
+            covariance = np.array(covariance)
 
         return cls(parameters=pars, covariance=covariance)
 
@@ -140,6 +140,16 @@ def test_parameters_covariance_to_table(pars):
     assert_allclose(table["ham"][1], 100)
 
 
+def test_parameters_to_dict_from_dict(pars):
+    pars2 = Parameters.from_dict(pars.to_dict())
+    assert pars2.names == ["spam", "ham"]
+    assert pars2.covariance is None
+
+    pars.set_error("ham", 10)
+    pars2 = Parameters.from_dict(pars.to_dict())
+    assert_allclose(pars2.covariance, pars.covariance)
+
+
 def test_parameters_set_parameter_factors(pars):
     pars.set_parameter_factors([77, 78])
     assert_allclose(pars["spam"].factor, 77)
@@ -8,6 +8,12 @@ from pathlib import Path
 
 __all__ = ["read_yaml", "write_yaml", "make_path", "recursive_merge_dicts"]
 
+# Use the LibYAML based loader and dumper if available, they are much faster
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
 
 def _configure_root_logger(level="info", format=None):
     """Configure root log level and format.
@@ -55,12 +61,12 @@ def read_yaml(filename, logger=None):
     if logger is not None:
         logger.info("Reading {}".format(filename))
     with open(str(filename)) as fh:
-        dictionary = yaml.safe_load(fh)
+        dictionary = yaml.load(fh, Loader=_SafeLoader)
 
     return dictionary
 
 
-def write_yaml(dictionary, filename, logger=None):
+def write_yaml(dictionary, filename, logger=None, mode="w"):
     """Write YAML file.
 
     Parameters
@@ -69,13 +75,17 @@ def write_yaml(dictionary, filename, logger=None):
         Python dictionary
     filename : str, `~gammapy.exter.pathlib.Path`
         file to write
+    mode : str
+        Write mode
     """
     filename = make_path(filename)
     filename.parent.mkdir(exist_ok=True)
     if logger is not None:
         logger.info("Writing {}".format(filename))
-    with open(str(filename), "w") as outfile:
-        outfile.write(yaml.safe_dump(dictionary, default_flow_style=False))
+    with open(str(filename), mode) as outfile:
+        outfile.write(
+            yaml.dump(dictionary, Dumper=_SafeDumper, default_flow_style=False)
+        )
 
 
 def make_path(path):
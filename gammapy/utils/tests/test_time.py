@@ -1,4 +1,5 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import numpy as np
 from numpy.testing import assert_allclose
 from astropy.time import TimeDelta, Time
 from ..time import (
@@ -41,6 +42,33 @@ def test_time_relative_to_ref():
     assert_allclose(delta_time.sec, delta_time_1sec.sec)
 
 
+def test_time_relative_to_ref_array():
+    time_ref_dict = dict(MJDREFI=500, MJDREFF=0.5)
+    time_ref = time_ref_from_dict(time_ref_dict)
+    time = time_ref + TimeDelta([1.0, 10.0, 100.0], format="sec")
+
+    delta_time = time_relative_to_ref(time, time_ref_dict)
+
+    assert delta_time.shape == (3,)
+    assert_allclose(delta_time.sec, [1.0, 10.0, 100.0])
+
+
+def test_time_relative_to_ref_meta():
+    time = Time(51910.5, format="mjd", scale="tt")
+
+    # array valued reference, e.g. from `time_ref_to_dict` on array input
+    meta = dict(MJDREFI=np.array([51910]), MJDREFF=np.array(0.5))
+    assert_allclose(time_relative_to_ref(time, meta).sec, 0)
+
+    # different TIMESYS must give a different reference
+    meta_tt = dict(MJDREFI=51910, MJDREFF=0.5, TIMESYS="TT")
+    meta_utc = dict(MJDREFI=51910, MJDREFF=0.5, TIMESYS="UTC")
+    delta_tt = time_relative_to_ref(time, meta_tt)
+    delta_utc = time_relative_to_ref(time, meta_utc)
+    assert_allclose(delta_tt.sec, 0)
+    assert_allclose(delta_utc.sec, -64.184)
+
+
 def test_absolute_time():
     time_ref_dict = dict(MJDREFI=51000, MJDREFF=0.5)
     time_ref = time_ref_from_dict(time_ref_dict)
@@ -1,5 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Time related utility functions."""
+from functools import lru_cache
 import numpy as np
 from astropy.time import Time, TimeDelta
 
@@ -28,12 +29,28 @@ def time_ref_from_dict(meta, format="mjd", scale="tt"):
     time : `~astropy.time.Time`
         Time object with ``format='MJD'``
     """
-    # Note: the float call here is to make sure we use 64-bit
-    mjd = float(meta["MJDREFI"]) + float(meta["MJDREFF"])
     scale = meta.get("TIMESYS", scale).lower()
+    return _time_ref(meta["MJDREFI"], meta["MJDREFF"], format, scale)
+
+
+def _time_ref(mjdrefi, mjdreff, format, scale):
+    # Note: the float call here is to make sure we use 64-bit
+    mjd = float(mjdrefi) + float(mjdreff)
     return Time(mjd, format=format, scale=scale)
 
 
+# Cached version for internal use only, where the returned `~astropy.time.Time`
+# is never handed out and can't be modified in place by the caller.
+_time_ref_cached = lru_cache(maxsize=32)(_time_ref)
+
+
+def _time_ref_from_dict_cached(meta):
+    # float() accepts e.g. 0-d arrays and gives a hashable, canonical cache key
+    mjdrefi, mjdreff = float(meta["MJDREFI"]), float(meta["MJDREFF"])
+    scale = meta.get("TIMESYS", "tt").lower()
+    return _time_ref_cached(mjdrefi, mjdreff, "mjd", scale)
+
+
 def time_ref_to_dict(time, scale="tt"):
     """TODO: document and test.
 
@@ -59,10 +76,14 @@ def time_relative_to_ref(time, meta):
     The time reference is built as MJDREFI + MJDREFF in units of MJD.
     The time will be converted to seconds after the reference.
 
+    Array-valued ``time`` is converted in a single vectorised operation, so
+    many times should be passed as one `~astropy.time.Time` array rather
+    than converted one by one.
+
     Parameters
     ----------
     time : `~astropy.time.Time`
-        time to be converted
+        time(s) to be converted
     meta : dict
         dictionary with the keywords ``MJDREFI`` and ``MJDREFF``
 
@@ -71,7 +92,7 @@ def time_relative_to_ref(time, meta):
     time_delta : `~astropy.time.TimeDelta`
         time in seconds after the reference
     """
-    time_ref = time_ref_from_dict(meta)
+    time_ref = _time_ref_from_dict_cached(meta)
     return TimeDelta(time - time_ref, format="sec")
 
 
@@ -90,5 +111,5 @@ def absolute_time(time_delta, meta):
     time : `~astropy.time.Time`
         absolute time with ``format='ISOT'`` and ``scale='UTC'``
     """
-    time = time_ref_from_dict(meta) + time_delta
+    time = _time_ref_from_dict_cached(meta) + time_delta
     return Time(time.utc.isot)
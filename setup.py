@@ -116,6 +116,7 @@ setup(
       analysis=[
           'reproject',
           'uncertainties>=2.4',
+          'numba',
           'naima',
           'iminuit>=1.3.2',
           'sherpa',